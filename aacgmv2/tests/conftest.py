@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures for the aacgmv2 test suite"""
+from __future__ import division, absolute_import, unicode_literals
+
+from collections import namedtuple
+import datetime as dt
+import pytest
+
+import aacgmv2
+
+AACGMEnv = namedtuple('AACGMEnv', ['dtime', 'ddate', 'in_args', 'lat_in',
+                                   'lon_in', 'alt_in', 'method', 'rtol'])
+
+
+@pytest.fixture(scope="session")
+def aacgm_env():
+    """Constant test inputs shared by the conversion test classes
+
+    Notes
+    -----
+    Under pytest-xdist each worker runs its own session, so this fixture runs
+    once per worker.
+
+    """
+    env = AACGMEnv(dtime=dt.datetime(2015, 1, 1, 0, 0, 0),
+                   ddate=dt.date(2015, 1, 1), in_args=(60, 0),
+                   lat_in=(60.0, 61.0), lon_in=(0.0, 0.0),
+                   alt_in=(300.0, 300.0), method='TRACE', rtol=1.0e-4)
+
+    # Run one conversion for the shared test date up front, so that the first
+    # coefficient load does not happen inside an individual test
+    aacgmv2.convert_latlon(60, 0, 300, env.dtime, 'TRACE')
+
+    return env
@@ -12,6 +12,50 @@ import warnings
 
 import aacgmv2
 
+# Reference output for 60 and 61 degrees latitude, 0 degrees longitude, and
+# 300 km altitude on 1 Jan 2015 using field-line tracing
+_REF_LATLON_ARR = np.array([[58.2268, 59.3184], [81.1613, 81.6080],
+                            [1.0457, 1.0456]])
+_REF_AACGM_ARR = np.array([[58.22676, 59.31847], [81.16135, 81.60797],
+                           [0.18880, 0.21857]])
+_REF_LATLON_SCALAR = np.array([58.2268, 81.1613, 1.0457])
+_REF_AACGM_SCALAR = np.array([58.2268, 81.1613, 0.1888])
+
+# Reference MLT and magnetic longitude pairs for 1 Jan 2015
+_MLT_IN = (12.0, 25.0, -1.0)
+_REF_MLON = np.array([-101.670617955439, 93.329382044561, 63.329382044561])
+_REF_MLT = np.array([12.7780412, 0.11137453, 12.44470786])
+
+# Reference arrays are shared by every test instance, so prevent any test
+# from changing them in place
+for _ref in (_REF_LATLON_ARR, _REF_AACGM_ARR, _REF_LATLON_SCALAR,
+             _REF_AACGM_SCALAR, _REF_MLON, _REF_MLT):
+    _ref.setflags(write=False)
+del _ref
+
+
+def _allclose_stack(out, ref, rtol):
+    """Compare a tuple of output arrays to a 2D reference in one assertion"""
+    np.testing.assert_allclose(np.asarray(out, dtype=float),
+                               np.asarray(ref, dtype=float), rtol=rtol)
+
+
+class AACGMEnvMixin(object):
+    """Binds the shared session inputs to every test in a conversion class"""
+
+    @pytest.fixture(autouse=True)
+    def _bind(self, aacgm_env):
+        """Runs before every method to create a clean testing setup"""
+        self.dtime = aacgm_env.dtime
+        self.ddate = aacgm_env.ddate
+        self.rtol = aacgm_env.rtol
+        self.out = None
+        self.bind_inputs(aacgm_env)
+
+    def bind_inputs(self, aacgm_env):
+        """Sets the class-specific inputs, override as needed"""
+        pass
+
 class TestFutureDepWarning:
     def setup(self):
         # Initialize the routine to be tested
@@ -82,21 +126,13 @@ class TestDepConvertWarning(TestFutureDepWarning):
             self.test_routine(*self.test_args, **self.test_kwargs)
 
 
-class TestConvertLatLon:
-    def setup(self):
-        """Runs before every method to create a clean testing setup"""
-        self.dtime = dt.datetime(2015, 1, 1, 0, 0, 0)
-        self.ddate = dt.date(2015, 1, 1)
-        self.in_args = [60, 0]
-        self.out = None
-        self.rtol = 1.0e-4
-
-    def teardown(self):
-        """Runs after every method to clean up previous testing"""
-        del self.out, self.in_args, self.rtol, self.dtime, self.ddate
+class TestConvertLatLon(AACGMEnvMixin):
+    def bind_inputs(self, aacgm_env):
+        """Sets the single location input arguments"""
+        self.in_args = list(aacgm_env.in_args)
 
     @pytest.mark.parametrize('alt,method_code,ref',
-                             [(300, 'TRACE', [58.2268,81.1613,1.0457]),
+                             [(300, 'TRACE', _REF_LATLON_SCALAR),
                               (3000.0, "G2A|BADIDEA", [64.3578,83.2895,1.4694]),
                               (7000.0, "G2A|TRACE|BADIDEA",
                                [69.3187,85.0845,2.0973])])
@@ -110,7 +146,7 @@ class TestConvertLatLon:
         """Test single latlon conversion with date and datetime input"""
         self.in_args.extend([300, self.ddate, 'TRACE'])
         self.out = aacgmv2.convert_latlon(*self.in_args)
-        np.testing.assert_allclose(self.out, [58.2268,81.1613,1.0457],
+        np.testing.assert_allclose(self.out, _REF_LATLON_SCALAR,
                                    rtol=self.rtol)
 
     @pytest.mark.skipif(version_info.major == 2,
@@ -118,47 +154,32 @@ class TestConvertLatLon:
     def test_convert_latlon_location_failure(self):
         """Test single value latlon conversion with a bad location"""
         self.out = aacgmv2.convert_latlon(0, 0, 0, self.dtime, self.in_args[-1])
-        assert np.all(np.isnan(np.array(self.out)))
-
-    def test_convert_latlon_time_failure(self):
-        """Test single value latlon conversion with a bad datetime"""
-        self.in_args.extend([300, None, 'TRACE'])
-        with pytest.raises(ValueError):
-            self.out = aacgmv2.convert_latlon(*self.in_args)
+        assert all(np.isnan(oo).all() for oo in self.out)
 
     def test_convert_latlon_maxalt_failure(self):
         """test convert_latlon failure for an altitude too high for coeffs"""
         self.in_args.extend([2001, self.dtime, ""])
         self.out = aacgmv2.convert_latlon(*self.in_args)
-        assert np.all(np.isnan(np.array(self.out)))
+        assert all(np.isnan(oo).all() for oo in self.out)
 
-    def test_convert_latlon_lat_high_failure(self):
-        """Test error return for co-latitudes above 90 for a single value"""
-        with pytest.raises(ValueError):
-            aacgmv2.convert_latlon(91, 0, 300, self.dtime)
-
-    def test_convert_latlon_lat_low_failure(self):
-        """Test error return for co-latitudes below -90 for a single value"""
+    @pytest.mark.parametrize('in_index,value',
+                             [(3, None), (0, 91.0), (0, -91.0)],
+                             ids=['time_none', 'lat_high', 'lat_low'])
+    def test_convert_latlon_raise_value_error(self, in_index, value):
+        """Test different ways to raise a ValueError"""
+        self.in_args.extend([300.0, self.dtime])
+        self.in_args[in_index] = value
         with pytest.raises(ValueError):
-            aacgmv2.convert_latlon(-91, 0, 300, self.dtime)
-
-class TestConvertLatLonArr:
-    def setup(self):
-        """Runs before every method to create a clean testing setup"""
-        self.dtime = dt.datetime(2015, 1, 1, 0, 0, 0)
-        self.ddate = dt.date(2015, 1, 1)
-        self.lat_in = [60.0, 61.0]
-        self.lon_in = [0.0, 0.0]
-        self.alt_in = [300.0, 300.0]
-        self.method = 'TRACE'
-        self.out = None
-        self.ref = [[58.2268, 59.3184], [81.1613, 81.6080], [1.0457, 1.0456]]
-        self.rtol = 1.0e-4
+            self.out = aacgmv2.convert_latlon(*self.in_args)
 
-    def teardown(self):
-        """Runs after every method to clean up previous testing"""
-        del self.lat_in, self.lon_in, self.alt_in, self.dtime, self.ddate
-        del self.method, self.out, self.ref, self.rtol
+class TestConvertLatLonArr(AACGMEnvMixin):
+    def bind_inputs(self, aacgm_env):
+        """Sets the array location inputs and reference output"""
+        self.lat_in = list(aacgm_env.lat_in)
+        self.lon_in = list(aacgm_env.lon_in)
+        self.alt_in = list(aacgm_env.alt_in)
+        self.method = aacgm_env.method
+        self.ref = _REF_LATLON_ARR
 
     def test_convert_latlon_arr_single_val(self):
         """Test array latlon conversion for a single value"""
@@ -167,10 +188,10 @@ class TestConvertLatLonArr:
                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_convert_latlon_arr_list_single(self):
         """Test array latlon conversion for list input of single values"""
@@ -180,10 +201,10 @@ class TestConvertLatLonArr:
                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_convert_latlon_arr_list(self):
         """Test array latlon conversion for list input"""
@@ -192,11 +213,10 @@ class TestConvertLatLonArr:
                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
-                for i, oo in enumerate(self.out)]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
+                   for i, oo in enumerate(self.out))
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_convert_latlon_arr_arr_single(self):
         """Test array latlon conversion for array input of shape (1,)"""
@@ -206,10 +226,10 @@ class TestConvertLatLonArr:
                                               self.dtime, self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_convert_latlon_arr_arr(self):
         """Test array latlon conversion for array input"""
@@ -219,11 +239,10 @@ class TestConvertLatLonArr:
                                               self.dtime, self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
-                for i, oo in enumerate(self.out)]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
+                   for i, oo in enumerate(self.out))
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_convert_latlon_arr_list_mix(self):
         """Test array latlon conversion for mixed types with list"""
@@ -232,11 +251,10 @@ class TestConvertLatLonArr:
                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
-                for i, oo in enumerate(self.out)]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
+                   for i, oo in enumerate(self.out))
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_convert_latlon_arr_arr_mix(self):
         """Test array latlon conversion for mixed type with an array"""
@@ -245,32 +263,26 @@ class TestConvertLatLonArr:
                                               self.dtime, self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
-                for i, oo in enumerate(self.out)]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
+                   for i, oo in enumerate(self.out))
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
-
-    def test_convert_latlon_arr_mult_failure(self):
-        """Test array latlon conversion for mix type with multi-dim array"""
-        with pytest.raises(ValueError):
-            aacgmv2.convert_latlon_arr(np.full(shape=(3,2), fill_value=50.0),
-                                       0, 300, self.dtime)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     @pytest.mark.parametrize('method_code,alt,ref',
-                             [("BADIDEA", 3000.0, [64.3580,83.2895,1.4694]),
+                             [("BADIDEA", 3000.0,
+                               [[64.3580], [83.2895], [1.4694]]),
                               ("BADIDEA|TRACE", 7000.0,
-                               [69.3187,85.0845,2.0973])])
+                               [[69.3187], [85.0845], [2.0973]])])
     def test_convert_latlon_arr_badidea(self, method_code, alt, ref):
         """Test array latlon conversion for BADIDEA"""
         self.out = aacgmv2.convert_latlon_arr(self.lat_in[0], self.lon_in[0],
                                               [alt], self.dtime, method_code)
 
         assert len(self.out) == len(ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [ref[i]], rtol=self.rtol)
+        _allclose_stack(self.out, ref, self.rtol)
 
     @pytest.mark.skipif(version_info.major == 2,
                         reason='Not raised in Python 2')
@@ -282,23 +294,12 @@ class TestConvertLatLonArr:
             warnings.simplefilter("ignore")
 
             # Trigger a warning
-            self.out = aacgmv2.convert_latlon_arr([0], [0], [0], self.dtime, "")
+            self.out = aacgmv2.convert_latlon_arr(np.zeros(1), np.zeros(1),
+                                                  np.zeros(1), self.dtime, "")
 
             # Test the output
             assert len(self.out) == len(self.ref)
-            assert np.any(~np.isfinite(np.array(self.out)))
-
-    def test_convert_latlon_arr_mult_arr_unequal_failure(self):
-        """Test array latlon conversion for unequal sized arrays"""
-        with pytest.raises(ValueError):
-            aacgmv2.convert_latlon_arr(np.array([[60, 61, 62], [63, 64, 65]]),
-                                       np.array([0, 1]), 300, self.dtime)
-
-    def test_convert_latlon_arr_time_failure(self):
-        """Test array latlon conversion with a bad time"""
-        with pytest.raises(ValueError):
-            aacgmv2.convert_latlon_arr(self.lat_in, self.lon_in, self.alt_in,
-                                       None, self.method)
+            assert any((~np.isfinite(oo)).any() for oo in self.out)
 
     def test_convert_latlon_arr_datetime_date(self):
         """Test array latlon conversion with date and datetime input"""
@@ -307,39 +308,44 @@ class TestConvertLatLonArr:
                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
-                for i, oo in enumerate(self.out)]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.ref[i])
+                   for i, oo in enumerate(self.out))
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_convert_latlon_arr_maxalt_failure(self):
         """test convert_latlon_arr failure for altitudes too high for coeffs"""
         self.method = ""
         self.out = aacgmv2.convert_latlon_arr(self.lat_in[0], self.lon_in[0],
-                                              [2001], self.dtime, self.method)
-        assert np.all(np.isnan(np.array(self.out)))
+                                              np.array([2001.0]), self.dtime,
+                                              self.method)
+        assert all(np.isnan(oo).all() for oo in self.out)
+
+    @pytest.mark.parametrize('bad_args',
+                             [{3: None},
+                              {0: [91, 60, -91], 1: 0, 2: 300},
+                              {0: np.full(shape=(3,2), fill_value=50.0),
+                               1: 0, 2: 300},
+                              {0: np.array([[60, 61, 62], [63, 64, 65]]),
+                               1: np.array([0, 1]), 2: 300}],
+                             ids=['time_none', 'lat', 'mult', 'mult_unequal'])
+    def test_convert_latlon_arr_raise_value_error(self, bad_args):
+        """Test different ways to raise a ValueError"""
+        in_args = [self.lat_in, self.lon_in, self.alt_in, self.dtime,
+                   self.method]
+        for in_index in bad_args.keys():
+            in_args[in_index] = bad_args[in_index]
 
-    def test_convert_latlon_arr_lat_failure(self):
-        """Test error return for co-latitudes above 90 for an array"""
         with pytest.raises(ValueError):
-            aacgmv2.convert_latlon_arr([91, 60, -91], 0, 300, self.dtime)
+            self.out = aacgmv2.convert_latlon_arr(*in_args)
 
-class TestGetAACGMCoord:
-    def setup(self):
-        """Runs before every method to create a clean testing setup"""
-        self.dtime = dt.datetime(2015, 1, 1, 0, 0, 0)
-        self.ddate = dt.date(2015, 1, 1)
-        self.in_args = [60, 0]
-        self.out = None
-        self.rtol = 1.0e-4
-
-    def teardown(self):
-        """Runs after every method to clean up previous testing"""
-        del self.out, self.in_args, self.rtol, self.dtime, self.ddate
+class TestGetAACGMCoord(AACGMEnvMixin):
+    def bind_inputs(self, aacgm_env):
+        """Sets the single location input arguments"""
+        self.in_args = list(aacgm_env.in_args)
 
     @pytest.mark.parametrize('alt,method_code,ref',
-                             [(300, 'TRACE', [58.2268,81.1613,0.1888]),
+                             [(300, 'TRACE', _REF_AACGM_SCALAR),
                               (3000.0, "G2A|BADIDEA", [64.3578,83.2895,0.3307]),
                               (7000.0, "G2A|TRACE|BADIDEA",
                                [69.3187,85.0845,0.4503])])
@@ -353,7 +359,7 @@ class TestGetAACGMCoord:
         """Test single AACGMV2 calculation with date and datetime input"""
         self.in_args.extend([300.0, self.ddate, 'TRACE'])
         self.out = aacgmv2.get_aacgm_coord(*self.in_args)
-        np.testing.assert_allclose(self.out, [58.2268,81.1613,0.1888],
+        np.testing.assert_allclose(self.out, _REF_AACGM_SCALAR,
                                    rtol=self.rtol)
 
     @pytest.mark.skipif(version_info.major == 2,
@@ -364,16 +370,17 @@ class TestGetAACGMCoord:
         self.in_args[0] = 0.0
 
         self.out = aacgmv2.get_aacgm_coord(*self.in_args)
-        np.all(np.isnan(np.array(self.out)))
+        assert all(np.isnan(oo).all() for oo in self.out)
 
     def test_get_aacgm_coord_maxalt_failure(self):
         """test get_aacgm_coord failure for an altitude too high for coeffs"""
         self.in_args.extend([2001, self.dtime, ""])
         self.out = aacgmv2.get_aacgm_coord(*self.in_args)
-        assert np.all(np.isnan(np.array(self.out)))
+        assert all(np.isnan(oo).all() for oo in self.out)
     
     @pytest.mark.parametrize('in_index,value',
-                             [(3, None), (0, 91.0), (0, -91.0)])
+                             [(3, None), (0, 91.0), (0, -91.0)],
+                             ids=['time_none', 'mlat_high', 'mlat_low'])
     def test_get_aacgm_coord_raise_value_error(self, in_index, value):
         """Test different ways to raise a ValueError"""
         self.in_args.extend([300.0, self.dtime])
@@ -382,23 +389,14 @@ class TestGetAACGMCoord:
             self.out = aacgmv2.get_aacgm_coord(*self.in_args)
 
 
-class TestGetAACGMCoordArr:
-    def setup(self):
-        """Runs before every method to create a clean testing setup"""
-        self.dtime = dt.datetime(2015, 1, 1, 0, 0, 0)
-        self.ddate = dt.date(2015, 1, 1)
-        self.lat_in = [60.0, 61.0]
-        self.lon_in = [0.0, 0.0]
-        self.alt_in = [300.0, 300.0]
-        self.method = 'TRACE'
-        self.out = None
-        self.ref = [[58.22676,59.31847], [81.16135,81.60797], [0.18880,0.21857]]
-        self.rtol = 1.0e-4
-
-    def teardown(self):
-        """Runs after every method to clean up previous testing"""
-        del self.out, self.ref, self.lat_in, self.dtime, self.ddate
-        del self.lon_in, self.alt_in, self.method, self.rtol
+class TestGetAACGMCoordArr(AACGMEnvMixin):
+    def bind_inputs(self, aacgm_env):
+        """Sets the array location inputs and reference output"""
+        self.lat_in = list(aacgm_env.lat_in)
+        self.lon_in = list(aacgm_env.lon_in)
+        self.alt_in = list(aacgm_env.alt_in)
+        self.method = aacgm_env.method
+        self.ref = _REF_AACGM_ARR
 
     def test_get_aacgm_coord_arr_single_val(self):
         """Test array AACGMV2 calculation for a single value"""
@@ -407,10 +405,10 @@ class TestGetAACGMCoordArr:
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_get_aacgm_coord_arr_list_single(self):
         """Test array AACGMV2 calculation for list input of single values"""
@@ -420,10 +418,10 @@ class TestGetAACGMCoordArr:
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_get_aacgm_coord_arr_list(self):
         """Test array AACGMV2 calculation for list input"""
@@ -432,11 +430,10 @@ class TestGetAACGMCoordArr:
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_get_aacgm_coord_arr_arr_single(self):
         """Test array AACGMV2 calculation for array with a single value"""
@@ -447,10 +444,10 @@ class TestGetAACGMCoordArr:
 
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, [self.ref[i][0]], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref[:, :1], self.rtol)
 
     def test_get_aacgm_coord_arr_arr(self):
         """Test array AACGMV2 calculation for an array"""
@@ -460,11 +457,10 @@ class TestGetAACGMCoordArr:
                                                self.dtime, self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_get_aacgm_coord_arr_list_mix(self):
         """Test array AACGMV2 calculation for a list and floats"""
@@ -473,11 +469,10 @@ class TestGetAACGMCoordArr:
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)  
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_get_aacgm_coord_arr_arr_mix(self):
         """Test array AACGMV2 calculation for an array and floats"""
@@ -486,19 +481,10 @@ class TestGetAACGMCoordArr:
                                                self.dtime, self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
-
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
-
-    def test_get_aacgm_coord_arr_mult_failure(self):
-        """Test aacgm_coord_arr failure with multi-dim array input"""
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
 
-        with pytest.raises(ValueError):
-            (self.mlat_out, self.mlon_out,
-             self.mlt_out) = aacgmv2.get_aacgm_coord_arr(
-                 np.array([[60, 61, 62], [63, 64, 65]]), 0, 300, self.dtime)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_get_aacgm_coord_arr_badidea(self):
         """Test array AACGMV2 calculation for BADIDEA"""
@@ -508,11 +494,11 @@ class TestGetAACGMCoordArr:
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
 
-        self.ref = [64.3481, 83.2885, 0.3306]
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        self.ref = [[64.3481], [83.2885], [0.3306]]
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     @pytest.mark.skipif(version_info.major == 2,
                         reason='Not raised in Python 2')
@@ -523,52 +509,50 @@ class TestGetAACGMCoordArr:
 
         
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == 1 for oo in self.out]
-        assert np.any([np.isnan(oo) for oo in self.out])
-
-    def test_get_aacgm_coord_arr_time_failure(self):
-        """Test array AACGMV2 calculation with a bad time"""
-        with pytest.raises(ValueError):
-            aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in, self.alt_in,
-                                        None, self.method)
-
-    def test_get_aacgm_coord_arr_mlat_failure(self):
-        """Test error return for co-latitudes above 90 for an array"""
+        assert all(isinstance(oo, np.ndarray) and len(oo) == 1
+                   for oo in self.out)
+        assert any(np.isnan(oo).any() for oo in self.out)
+
+    @pytest.mark.parametrize('bad_args',
+                             [{3: None},
+                              {0: [91, 60, -91], 1: 0.0, 2: 300.0},
+                              {0: np.array([[60, 61, 62], [63, 64, 65]]),
+                               1: 0, 2: 300}],
+                             ids=['time_none', 'mlat', 'mult'])
+    def test_get_aacgm_coord_arr_raise_value_error(self, bad_args):
+        """Test different ways to raise a ValueError"""
+        in_args = [self.lat_in, self.lon_in, self.alt_in, self.dtime,
+                   self.method]
+        for in_index in bad_args.keys():
+            in_args[in_index] = bad_args[in_index]
 
-        self.lat_in = [91, 60, -91]
         with pytest.raises(ValueError):
-            self.out = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in[0],
-                                                   self.alt_in[0], self.dtime,
-                                                   self.method)
+            self.out = aacgmv2.get_aacgm_coord_arr(*in_args)
 
     def test_get_aacgm_coord_arr_datetime_date(self):
         """Test array AACGMV2 calculation with date and datetime input"""
         self.out = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in,
                                                self.alt_in, self.ddate,
                                                self.method)
-        self.ref = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in,
-                                               self.alt_in, self.dtime,
-                                               self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
 
-        for i, oo in enumerate(self.out):
-            np.testing.assert_allclose(oo, self.ref[i], rtol=self.rtol)
+        _allclose_stack(self.out, self.ref, self.rtol)
 
     def test_get_aacgm_coord_arr_maxalt_failure(self):
         """test aacgm_coord_arr failure for an altitude too high for coeff"""
         self.method = ""
-        self.alt_in = [2001 for ll in self.lat_in]
+        self.alt_in = np.full(len(self.lat_in), 2001.0)
         self.out = aacgmv2.get_aacgm_coord_arr(self.lat_in, self.lon_in,
                                                self.alt_in, self.dtime,
                                                self.method)
 
         assert len(self.out) == len(self.ref)
-        assert [isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
-                for oo in self.out]
-        assert np.all(np.isnan(np.array(self.out)))
+        assert all(isinstance(oo, np.ndarray) and len(oo) == len(self.lat_in)
+                   for oo in self.out)
+        assert all(np.isnan(oo).all() for oo in self.out)
 
 
 class TestConvertCode:
@@ -578,31 +562,30 @@ class TestConvertCode:
     def teardown(self):
         del self.c_method_code
 
-    @pytest.mark.parametrize('method_code',
-                             [('G2A'), ('A2G'), ('TRACE'), ('ALLOWTRACE'),
-                              ('BADIDEA'), ('GEOCENTRIC'), ('g2a')])
-    def test_convert_str_to_bit(self, method_code):
+    @pytest.mark.parametrize('method_code,bit_names',
+                             [('G2A', ['G2A']), ('A2G', ['A2G']),
+                              ('TRACE', ['TRACE']),
+                              ('ALLOWTRACE', ['ALLOWTRACE']),
+                              ('BADIDEA', ['BADIDEA']),
+                              ('GEOCENTRIC', ['GEOCENTRIC']),
+                              ('g2a', ['G2A']),
+                              ('G2A | trace', ['G2A', 'TRACE']),
+                              ('ggoogg|', ['G2A'])],
+                             ids=['G2A', 'A2G', 'TRACE', 'ALLOWTRACE',
+                                  'BADIDEA', 'GEOCENTRIC', 'lowercase',
+                                  'spaces', 'invalid'])
+    def test_convert_str_to_bit(self, method_code, bit_names):
         """Test conversion from string code to bit"""
-        if hasattr(aacgmv2._aacgmv2, method_code.upper()):
-            self.c_method_code = getattr(aacgmv2._aacgmv2, method_code.upper())
-        else:
-            raise ValueError('cannot find method in C code: {:}'.format(
-                method_code))
+        self.c_method_code = 0
+        for bname in bit_names:
+            if hasattr(aacgmv2._aacgmv2, bname):
+                self.c_method_code += getattr(aacgmv2._aacgmv2, bname)
+            else:
+                raise ValueError('cannot find method in C code: {:}'.format(
+                    bname))
 
         assert aacgmv2.convert_str_to_bit(method_code) == self.c_method_code
 
-
-    def test_convert_str_to_bit_spaces(self):
-        """Test conversion from string code to bit for a code with spaces"""
-        if(aacgmv2.convert_str_to_bit("G2A | trace") !=
-           aacgmv2._aacgmv2.G2A + aacgmv2._aacgmv2.TRACE):
-            raise AssertionError()
-
-    def test_convert_str_to_bit_invalid(self):
-        """Test conversion from string code to bit for an invalid code"""
-        if aacgmv2.convert_str_to_bit("ggoogg|") != aacgmv2._aacgmv2.G2A:
-            raise AssertionError()
-
     @pytest.mark.parametrize('bool_dict,method_code',
                              [({}, 'G2A'), ({'a2g': True}, 'A2G'),
                               ({'trace': True}, 'TRACE'),
@@ -620,26 +603,19 @@ class TestConvertCode:
         assert aacgmv2.convert_bool_to_bit(**bool_dict) == self.c_method_code
 
 
-class TestMLTConvert:
-    def setup(self):
-        """Runs before every method to create a clean testing setup"""
-        self.dtime = dt.datetime(2015, 1, 1, 0, 0, 0)
+class TestMLTConvert(AACGMEnvMixin):
+    def bind_inputs(self, aacgm_env):
+        """Sets the MLT inputs and reference output"""
         self.dtime2 = dt.datetime(2015, 1, 1, 10, 0, 0)
-        self.ddate = dt.date(2015, 1, 1)
         self.mlon_out = None
         self.mlt_out = None
         self.mlt_diff = None
         self.mlon_list = [270.0, 80.0, -95.0]
-        self.mlt_list = [12.0, 25.0, -1.0]
-        self.mlon_comp = [-101.670617955439, 93.329382044561, 63.329382044561]
-        self.mlt_comp = [12.7780412 ,  0.11137453, 12.44470786]
+        self.mlt_list = list(_MLT_IN)
+        self.mlon_comp = _REF_MLON
+        self.mlt_comp = _REF_MLT
         self.diff_comp = np.ones(shape=(3,)) * -10.52411552
 
-    def teardown(self):
-        """Runs after every method to clean up previous testing"""
-        del self.mlon_out, self.mlt_out, self.mlt_list, self.mlon_list
-        del self.mlon_comp, self.mlt_comp, self.mlt_diff, self.diff_comp
-
     def test_date_input(self):
         """Test to see that the date input works"""
         self.mlt_out = aacgmv2.convert_mlt(self.mlon_list, self.ddate,
@@ -651,12 +627,11 @@ class TestMLTConvert:
         with pytest.raises(ValueError):
             self.mlt_out = aacgmv2.wrapper.convert_mlt(self.mlon_list, 1997)
 
-    def test_inv_convert_mlt_single(self):
+    @pytest.mark.parametrize('mlt,mlon_comp', list(zip(_MLT_IN, _REF_MLON)))
+    def test_inv_convert_mlt_single(self, mlt, mlon_comp):
         """Test MLT inversion for a single value"""
-        for i,mlt in enumerate(self.mlt_list):
-            self.mlon_out = aacgmv2.convert_mlt(mlt, self.dtime, m2a=True)
-            np.testing.assert_almost_equal(self.mlon_out, self.mlon_comp[i],
-                                           decimal=4)
+        self.mlon_out = aacgmv2.convert_mlt(mlt, self.dtime, m2a=True)
+        np.testing.assert_almost_equal(self.mlon_out, mlon_comp, decimal=4)
 
     def test_inv_convert_mlt_list(self):
         """Test MLT inversion for a list"""